@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-DATA_PATH = Path(__file__).parent / "data" / "city_infrastructure_sample.csv"
+from schema import COLUMN_DTYPES
+
+DATA_PATH = Path(__file__).parent / "data" / "city_infrastructure_sample.parquet"
+
+# Ordered categories for the derived risk_level column, lowest risk first.
+RISK_LEVELS = ["Low", "Moderate", "High"]
+
+# Indicators averaged per country for the overview summary chart.
+SUMMARY_COLUMNS = ["risk_score", "avg_infrastructure_quality", "disaster_preparedness_score"]
+
+# Rows shown in the city table unless the user asks to see every city.
+TABLE_ROW_LIMIT = 50
+
+# Columns referenced by the visual analytics chart specs (risk, scatter, geo).
+VISUAL_COLUMNS = [
+    "city",
+    "country",
+    "longitude",
+    "latitude",
+    "avg_infrastructure_quality",
+    "risk_score",
+    "risk_level",
+    "population_millions",
+]
 
 
 @dataclass
@@ -22,67 +46,218 @@ class RiskWeights:
     economic: float = 0.2
     population: float = 0.2
 
-    @property
-    def normalized(self) -> Dict[str, float]:
+    def normalized(self) -> RiskWeights:
+        """Return a copy of the weights rescaled to sum to one."""
+
         total = self.infrastructure + self.preparedness + self.economic + self.population
         if total == 0:
             # Avoid division by zero and default to equal weights.
-            return {key: 0.25 for key in ("infrastructure", "preparedness", "economic", "population")}
-        return {
-            "infrastructure": self.infrastructure / total,
-            "preparedness": self.preparedness / total,
-            "economic": self.economic / total,
-            "population": self.population / total,
-        }
+            return RiskWeights(0.25, 0.25, 0.25, 0.25)
+        return RiskWeights(
+            infrastructure=self.infrastructure / total,
+            preparedness=self.preparedness / total,
+            economic=self.economic / total,
+            population=self.population / total,
+        )
 
+    def as_array(self) -> np.ndarray:
+        """Return the weights as a float32 vector in pillar order."""
 
+        return np.array(
+            [self.infrastructure, self.preparedness, self.economic, self.population],
+            dtype=np.float32,
+        )
+
+
+@st.cache_data(ttl=None, show_spinner=False)
 def load_data() -> pd.DataFrame:
     """Load infrastructure indicators for each city."""
 
-    df = pd.read_csv(DATA_PATH)
+    # No-op for an up-to-date Parquet file; guards against a stale one.
+    df = pd.read_parquet(DATA_PATH, engine="pyarrow").astype(COLUMN_DTYPES, copy=False)
     return df
 
 
 def compute_risk_scores(df: pd.DataFrame, weights: RiskWeights) -> pd.DataFrame:
-    """Derive risk scores and supporting indicators for each city."""
+    """Derive risk scores and supporting indicators for each city.
+
+    ``weights`` are expected to be normalized already (see ``RiskWeights.normalized``).
+    """
+
+    return _compute_risk_scores_cached(df, weights.as_array())
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_risk_scores_cached(df: pd.DataFrame, weights: np.ndarray) -> pd.DataFrame:
+    """Score ``df`` with a normalized weight vector, memoized per weight combination."""
+
+    avg_infra_quality, pillars = _compute_pillars(df)
+    infrastructure_gap, preparedness_gap, economic_vulnerability, population_pressure = pillars.T
+
+    risk_score = pillars @ weights
+
+    derived = {
+        "avg_infrastructure_quality": avg_infra_quality,
+        "infrastructure_gap": infrastructure_gap,
+        "preparedness_gap": preparedness_gap,
+        "economic_vulnerability": economic_vulnerability,
+        "population_pressure": population_pressure,
+        "risk_score": risk_score,
+        # right=True: scores of exactly 40 and 60 fall in the lower level.
+        "risk_level": pd.Categorical.from_codes(
+            np.digitize(risk_score, [40.0, 60.0], right=True),
+            categories=RISK_LEVELS,
+            ordered=True,
+        ),
+    }
+    return pd.concat([df, pd.DataFrame(derived, index=df.index)], axis=1)
+
+
+@st.cache_data(show_spinner=False)
+def _compute_pillars(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the weight-independent risk pillars for each city.
+
+    Returns the average infrastructure quality and an (N, 4) matrix whose columns
+    are the infrastructure, preparedness, economic and population pillars, in the
+    same order as ``RiskWeights.as_array``.
+    """
 
-    wt = weights.normalized
     infra_columns = [
         "road_quality_index",
         "power_grid_stability",
         "water_security",
         "healthcare_capacity",
     ]
-    avg_infra_quality = df[infra_columns].mean(axis=1)
-    infrastructure_gap = 100 - avg_infra_quality
+    # Column-major so each pillar column is contiguous when written in place.
+    pillars = np.empty((len(df), 4), dtype=np.float32, order="F")
+    infrastructure_gap, preparedness_gap, economic_vulnerability, population_pressure = pillars.T
+
+    avg_infra_quality = df[infra_columns].to_numpy(dtype=np.float32).mean(axis=1)
+    np.subtract(100.0, avg_infra_quality, out=infrastructure_gap)
+
+    np.subtract(
+        100.0,
+        df["disaster_preparedness_score"].to_numpy(dtype=np.float32),
+        out=preparedness_gap,
+    )
+
+    gdp = df["gdp_per_capita_usd"].to_numpy(dtype=np.float32)
+    np.clip(gdp, 0, None, out=economic_vulnerability)
+    np.subtract(60000.0, economic_vulnerability, out=economic_vulnerability)
+    np.maximum(economic_vulnerability, 0, out=economic_vulnerability)
+    economic_vulnerability /= 60000.0
+    economic_vulnerability *= 100.0
+
+    population = df["population_millions"].to_numpy(dtype=np.float32)
+    np.divide(population, population.max(), out=population_pressure)
+    population_pressure *= 100.0
+
+    return avg_infra_quality, pillars
+
 
-    preparedness_gap = 100 - df["disaster_preparedness_score"]
+@st.cache_data(show_spinner=False, max_entries=32)
+def _summarize_by_country(df: pd.DataFrame) -> pd.DataFrame:
+    """Average the headline indicators per country, memoized per scored frame."""
 
-    gdp_cap = df["gdp_per_capita_usd"].clip(lower=0)
-    economic_vulnerability = ((60000 - gdp_cap).clip(lower=0) / 60000) * 100
+    return df.groupby("country", observed=True)[SUMMARY_COLUMNS].mean().reset_index()
 
-    population_pressure = (df["population_millions"] / df["population_millions"].max()) * 100
 
-    risk_score = (
-        wt["infrastructure"] * infrastructure_gap
-        + wt["preparedness"] * preparedness_gap
-        + wt["economic"] * economic_vulnerability
-        + wt["population"] * population_pressure
+def _vega_lite_spec(chart: alt.Chart) -> dict:
+    """Compile a data-less Altair chart into a Vega-Lite spec.
+
+    Like ``st.altair_chart``, Altair's default theme is swapped for "none" while any
+    other enabled theme is kept. The data is passed separately to
+    ``st.vega_lite_chart`` so it is still shipped as Arrow.
+    """
+
+    theme = alt.themes.enable("none") if alt.themes.active == "default" else nullcontext()
+    with theme:
+        spec = chart.to_dict()
+    # Altair adds a placeholder dataset to data-less charts; it would shadow the frame.
+    spec.pop("data", None)
+    spec.pop("datasets", None)
+    return spec
+
+
+@st.cache_data(show_spinner=False)
+def _summary_chart_spec() -> dict:
+    chart = (
+        alt.Chart()
+        .transform_fold(SUMMARY_COLUMNS, as_=["metric", "value"])
+        .mark_bar()
+        .encode(
+            x=alt.X("country:N", title="Country"),
+            y=alt.Y("value:Q", title="Score"),
+            color=alt.Color("metric:N", title="Metric"),
+            column=alt.Column("metric:N", title=""),
+            tooltip=["country:N", "metric:N", alt.Tooltip("value:Q", format=".1f")],
+        )
+        .properties(width=120)
     )
+    return _vega_lite_spec(chart)
+
 
-    result = df.copy()
-    result["avg_infrastructure_quality"] = avg_infra_quality
-    result["infrastructure_gap"] = infrastructure_gap
-    result["preparedness_gap"] = preparedness_gap
-    result["economic_vulnerability"] = economic_vulnerability
-    result["population_pressure"] = population_pressure
-    result["risk_score"] = risk_score
-    result["risk_level"] = pd.cut(
-        risk_score,
-        bins=[-1, 40, 60, 100],
-        labels=["Low", "Moderate", "High"],
+@st.cache_data(show_spinner=False)
+def _risk_chart_spec() -> dict:
+    chart = (
+        alt.Chart()
+        .mark_bar()
+        .encode(
+            x=alt.X("city:N", sort="-y", title="City"),
+            y=alt.Y("risk_score:Q", title="Risk score"),
+            color=alt.Color("risk_level:N", title="Risk level", sort=RISK_LEVELS),
+            tooltip=[
+                "city:N",
+                "country:N",
+                alt.Tooltip("risk_score:Q", format=".1f"),
+                "risk_level:O",
+            ],
+        )
     )
-    return result
+    return _vega_lite_spec(chart)
+
+
+@st.cache_data(show_spinner=False)
+def _scatter_chart_spec() -> dict:
+    chart = (
+        alt.Chart()
+        .mark_circle(size=120, opacity=0.7)
+        .encode(
+            x=alt.X("avg_infrastructure_quality:Q", title="Average infrastructure quality"),
+            y=alt.Y("risk_score:Q", title="Risk score"),
+            color=alt.Color("country:N", title="Country"),
+            tooltip=[
+                "city:N",
+                "country:N",
+                alt.Tooltip("avg_infrastructure_quality:Q", format=".1f"),
+                alt.Tooltip("risk_score:Q", format=".1f"),
+                alt.Tooltip("population_millions:Q", title="Population (M)", format=".1f"),
+            ],
+        )
+    )
+    return _vega_lite_spec(chart)
+
+
+@st.cache_data(show_spinner=False)
+def _geo_chart_spec() -> dict:
+    chart = (
+        alt.Chart()
+        .mark_circle(size=160, opacity=0.6)
+        .encode(
+            longitude="longitude:Q",
+            latitude="latitude:Q",
+            color=alt.Color("risk_level:N", title="Risk level", sort=RISK_LEVELS),
+            size=alt.Size("risk_score:Q", title="Risk score"),
+            tooltip=[
+                "city:N",
+                "country:N",
+                alt.Tooltip("risk_score:Q", format=".1f"),
+                "risk_level:O",
+            ],
+        )
+        .project(type="mercator")
+    )
+    return _vega_lite_spec(chart)
 
 
 def render_overview(df: pd.DataFrame) -> None:
@@ -95,33 +270,22 @@ def render_overview(df: pd.DataFrame) -> None:
         """
     )
 
-    summary_columns = ["risk_score", "avg_infrastructure_quality", "disaster_preparedness_score"]
-    summary = df.groupby("country")[summary_columns].mean().reset_index()
-    summary_chart = (
-        alt.Chart(summary)
-        .transform_fold(summary_columns, as_=["metric", "value"])
-        .mark_bar()
-        .encode(
-            x=alt.X("country:N", title="Country"),
-            y=alt.Y("value:Q", title="Score"),
-            color=alt.Color("metric:N", title="Metric"),
-            column=alt.Column("metric:N", title=""),
-            tooltip=["country", "metric", alt.Tooltip("value", format=".1f")],
-        )
-        .properties(width=120)
-    )
-    st.altair_chart(summary_chart, use_container_width=True)
+    summary = _summarize_by_country(df)
+    st.vega_lite_chart(summary, _summary_chart_spec(), use_container_width=True)
+
+    risk_scores = df["risk_score"].to_numpy()
+    cities = df["city"].to_numpy()
 
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Highest risk city", df.loc[df["risk_score"].idxmax(), "city"])
+        st.metric("Highest risk city", cities[risk_scores.argmax()])
         st.metric(
             "Average risk score",
-            f"{df['risk_score'].mean():.1f}",
-            delta=f"±{df['risk_score'].std():.1f} (stdev)",
+            f"{risk_scores.mean():.1f}",
+            delta=f"±{risk_scores.std(ddof=1):.1f} (stdev)",  # sample stdev
         )
     with col2:
-        st.metric("Most resilient city", df.loc[df["risk_score"].idxmin(), "city"])
+        st.metric("Most resilient city", cities[risk_scores.argmin()])
         st.metric("Cities assessed", len(df))
 
 
@@ -138,67 +302,31 @@ def render_city_table(df: pd.DataFrame) -> None:
         "economic_vulnerability",
         "population_pressure",
     ]
+    show_all = len(df) > TABLE_ROW_LIMIT and st.toggle(f"Show all {len(df)} cities")
+    if show_all:
+        table = df[columns].sort_values("risk_score", ascending=False)
+    else:
+        table = df[columns].nlargest(TABLE_ROW_LIMIT, "risk_score")
     st.dataframe(
-        df[columns]
-        .sort_values("risk_score", ascending=False)
-        .style.format(
-            {
-                "risk_score": "{:.1f}",
-                "avg_infrastructure_quality": "{:.1f}",
-                "disaster_preparedness_score": "{:.0f}",
-                "economic_vulnerability": "{:.0f}",
-                "population_pressure": "{:.0f}",
-            }
-        )
+        table,
+        column_config={
+            "risk_score": st.column_config.NumberColumn(format="%.1f"),
+            "avg_infrastructure_quality": st.column_config.NumberColumn(format="%.1f"),
+            "disaster_preparedness_score": st.column_config.NumberColumn(format="%.0f"),
+            "economic_vulnerability": st.column_config.NumberColumn(format="%.0f"),
+            "population_pressure": st.column_config.NumberColumn(format="%.0f"),
+        },
+        hide_index=True,
     )
 
 
 def render_visuals(df: pd.DataFrame) -> None:
     st.subheader("Visual analytics")
 
-    risk_chart = (
-        alt.Chart(df)
-        .mark_bar()
-        .encode(
-            x=alt.X("city:N", sort="-y", title="City"),
-            y=alt.Y("risk_score:Q", title="Risk score"),
-            color=alt.Color("risk_level:N", title="Risk level"),
-            tooltip=["city", "country", alt.Tooltip("risk_score", format=".1f"), "risk_level"],
-        )
-    )
-    st.altair_chart(risk_chart, use_container_width=True)
-
-    scatter = (
-        alt.Chart(df)
-        .mark_circle(size=120, opacity=0.7)
-        .encode(
-            x=alt.X("avg_infrastructure_quality:Q", title="Average infrastructure quality"),
-            y=alt.Y("risk_score:Q", title="Risk score"),
-            color=alt.Color("country:N", title="Country"),
-            tooltip=[
-                "city",
-                "country",
-                alt.Tooltip("avg_infrastructure_quality", format=".1f"),
-                alt.Tooltip("risk_score", format=".1f"),
-                alt.Tooltip("population_millions", title="Population (M)", format=".1f"),
-            ],
-        )
-    )
-    st.altair_chart(scatter, use_container_width=True)
-
-    geo = (
-        alt.Chart(df)
-        .mark_circle(size=160, opacity=0.6)
-        .encode(
-            longitude="longitude:Q",
-            latitude="latitude:Q",
-            color=alt.Color("risk_level:N", title="Risk level"),
-            size=alt.Size("risk_score:Q", title="Risk score"),
-            tooltip=["city", "country", alt.Tooltip("risk_score", format=".1f"), "risk_level"],
-        )
-        .project(type="mercator")
-    )
-    st.altair_chart(geo, use_container_width=True)
+    chart_df = df[VISUAL_COLUMNS]
+    st.vega_lite_chart(chart_df, _risk_chart_spec(), use_container_width=True)
+    st.vega_lite_chart(chart_df, _scatter_chart_spec(), use_container_width=True)
+    st.vega_lite_chart(chart_df, _geo_chart_spec(), use_container_width=True)
 
 
 def render_sidebar(df: pd.DataFrame) -> RiskWeights:
@@ -227,12 +355,13 @@ def render_sidebar(df: pd.DataFrame) -> RiskWeights:
         f"{df['population_millions'].sum():.1f} million residents",
     )
 
+    # Normalize once here so the scoring path can use the weights as-is.
     return RiskWeights(
         infrastructure=infrastructure,
         preparedness=preparedness,
         economic=economic,
         population=population,
-    )
+    ).normalized()
 
 
 def main() -> None:
@@ -0,0 +1,17 @@
+"""Column dtypes for the city infrastructure dataset, shared by the app and scripts."""
+
+# Numeric indicators are small-range values, so float32 is ample and halves the
+# cached frame; the low-cardinality labels are stored as categoricals.
+COLUMN_DTYPES = {
+    "country": "category",
+    "region": "category",
+    "population_millions": "float32",
+    "gdp_per_capita_usd": "float32",
+    "road_quality_index": "float32",
+    "power_grid_stability": "float32",
+    "water_security": "float32",
+    "healthcare_capacity": "float32",
+    "disaster_preparedness_score": "float32",
+    "latitude": "float32",
+    "longitude": "float32",
+}
@@ -0,0 +1,32 @@
+"""Convert the sample infrastructure dataset from CSV to Parquet.
+
+The dashboard loads ``data/city_infrastructure_sample.parquet`` because Arrow
+reads typed columns straight into pandas without tokenizing text. Columns are
+stored with the app's compact dtypes (float32 indicators, categorical labels),
+so numeric columns are half as wide and need no conversion on load. The CSV
+remains the editable source; after changing it, rerun this script from the
+repository root::
+
+    python -m scripts.convert_sample_to_parquet
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from schema import COLUMN_DTYPES
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+CSV_PATH = BASE_DIR / "data" / "city_infrastructure_sample.csv"
+PARQUET_PATH = CSV_PATH.with_suffix(".parquet")
+
+
+def main() -> None:
+    df = pd.read_csv(CSV_PATH, dtype=COLUMN_DTYPES)
+    df.to_parquet(PARQUET_PATH, engine="pyarrow", index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,18 @@
 
 This script renders the structured user stories, acceptance criteria, and
 implementation notes into a PDF document using ReportLab. The resulting file
-is stored under ``docs/Infrastructure_Risk_Intelligence_v2.pdf``.
+is stored under ``docs/Infrastructure_Risk_Intelligence_v2.pdf`` unless one or
+more output paths are passed on the command line; several paths are rendered
+in parallel worker processes.
 """
 
 from __future__ import annotations
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Sequence
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER
@@ -39,8 +45,8 @@ def _build_title(styles) -> list:
             "Mission Analysis, Regional Operations, Risk Data Engineering",
         ),
     ]
-    for label, value in metadata:
-        content.append(Paragraph(f"<b>{label}:</b> {value}", styles["BodyText"]))
+    body = styles["BodyText"]
+    content.extend(Paragraph(f"<b>{label}:</b> {value}", body) for label, value in metadata)
     content.append(Spacer(1, 0.25 * inch))
     return content
 
@@ -59,10 +65,10 @@ def _build_overview(styles) -> list:
         "data from PDF sources to keep risk scores continuously aligned with the latest "
         "intelligence.",
     ]
-    content = [Paragraph("Overview", styles["Heading1"]), Paragraph(overview, styles["BodyText"]) ]
+    body = styles["BodyText"]
+    content = [Paragraph("Overview", styles["Heading1"]), Paragraph(overview, body)]
     content.append(Spacer(1, 0.1 * inch))
-    for bullet in bullets:
-        content.append(Paragraph(f"• {bullet}", styles["BodyText"]))
+    content.extend(Paragraph(f"• {bullet}", body) for bullet in bullets)
     content.append(Spacer(1, 0.25 * inch))
     return content
 
@@ -91,26 +97,27 @@ def _build_table(title: str, headers: list[str], rows: list[list[str]], styles)
 
 
 def _story_block(title: str, persona: str, want: str, purpose: str, description: str, criteria: list[str], example: list[str] | None, outcome: list[str], styles) -> list:  # noqa: E501
-    content = [Paragraph(title, styles["Heading1"])]
-    content.append(Paragraph(f"<b>As a</b> {persona}", styles["BodyText"]))
-    content.append(Paragraph(f"<b>I want</b> {want}", styles["BodyText"]))
-    content.append(Paragraph(f"<b>So that</b> {purpose}", styles["BodyText"]))
-    content.append(Spacer(1, 0.1 * inch))
-    content.append(Paragraph("Description", styles["Heading2"]))
-    content.append(Paragraph(description, styles["BodyText"]))
-    content.append(Spacer(1, 0.05 * inch))
-    content.append(Paragraph("Acceptance Criteria", styles["Heading2"]))
-    for item in criteria:
-        content.append(Paragraph(f"• {item}", styles["BodyText"]))
+    body = styles["BodyText"]
+    heading = styles["Heading2"]
+    content = [
+        Paragraph(title, styles["Heading1"]),
+        Paragraph(f"<b>As a</b> {persona}", body),
+        Paragraph(f"<b>I want</b> {want}", body),
+        Paragraph(f"<b>So that</b> {purpose}", body),
+        Spacer(1, 0.1 * inch),
+        Paragraph("Description", heading),
+        Paragraph(description, body),
+        Spacer(1, 0.05 * inch),
+        Paragraph("Acceptance Criteria", heading),
+    ]
+    content.extend(Paragraph(f"• {item}", body) for item in criteria)
     if example:
         content.append(Spacer(1, 0.05 * inch))
-        content.append(Paragraph("Example", styles["Heading2"]))
-        for line in example:
-            content.append(Paragraph(f"• {line}", styles["BodyText"]))
+        content.append(Paragraph("Example", heading))
+        content.extend(Paragraph(f"• {line}", body) for line in example)
     content.append(Spacer(1, 0.05 * inch))
-    content.append(Paragraph("Outcome", styles["Heading2"]))
-    for line in outcome:
-        content.append(Paragraph(f"• {line}", styles["BodyText"]))
+    content.append(Paragraph("Outcome", heading))
+    content.extend(Paragraph(f"• {line}", body) for line in outcome)
     content.append(Spacer(1, 0.3 * inch))
     return content
 
@@ -391,11 +398,25 @@ def _build_document() -> list:
     return story
 
 
-def main() -> None:
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    doc = SimpleDocTemplate(str(OUTPUT_PATH), pagesize=LETTER)
+def _render_one(output_path: Path) -> Path:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    doc = SimpleDocTemplate(str(output_path), pagesize=LETTER)
     doc.build(_build_document())
+    return output_path
+
+
+def main(output_paths: Sequence[Path] = (OUTPUT_PATH,)) -> None:
+    if not output_paths:
+        return
+    if len(output_paths) == 1:
+        _render_one(output_paths[0])
+        return
+    # ReportLab holds the GIL while laying out pages, so independent briefs are
+    # rendered in separate processes rather than threads.
+    max_workers = min(len(output_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_render_one, output_paths))
 
 
 if __name__ == "__main__":
-    main()
+    main([Path(arg) for arg in sys.argv[1:]] or (OUTPUT_PATH,))